@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled per-access lookup of the cache. Build it in place with
+
+    cythonize -i cache_core.pyx
+
+code.py uses FastCache for Cache.check() when the extension is available and falls
+back to NumPy otherwise.
+"""
+
+cdef class FastCache:
+    """
+    A view of the ways of a Cache that looks up single addresses in C. The array is
+    shared with the Cache, so lookups through Cache.check() and whole traces run by
+    Cache.simulate() see the same cache contents.
+    """
+    cdef unsigned int[:, ::1] ways
+    cdef int associativity
+    cdef int index_shift
+    cdef unsigned long long index_mask
+    cdef int tag_shift
+
+    def __init__(self, ways, int index_shift, unsigned long long index_mask, int tag_shift):
+        """
+        Wrap the ways of a cache whose tags are at most 31 bits wide.
+
+        Args:
+            ways (np.ndarray): uint32 words holding (tag << 1) | valid, one row per set,
+                ordered from most to least recently used.
+            index_shift (int): Number of offset bits below the index.
+            index_mask (int): Mask selecting the index bits.
+            tag_shift (int): Number of offset and index bits below the tag.
+        """
+        self.ways = ways
+        self.associativity = ways.shape[1]
+        self.index_shift = index_shift
+        self.index_mask = index_mask
+        self.tag_shift = tag_shift
+
+    cpdef bint check(self, unsigned long long address):
+        """
+        Look up an address, moving it to the front of its set and installing it on a miss.
+
+        Args:
+            address (int): The 32-bit address from the processor.
+
+        Returns:
+            bool: True if the access was a hit, False otherwise.
+        """
+        cdef Py_ssize_t index = (address >> self.index_shift) & self.index_mask
+        cdef unsigned int key = ((address >> self.tag_shift) << 1) | 1
+        cdef int pos = 0
+        cdef int p
+        # Empty ways are zero and sit at the back of the set, so the scan can stop there
+        while pos < self.associativity and self.ways[index, pos] != key and self.ways[index, pos] != 0:
+            pos += 1
+        cdef bint hit = pos < self.associativity and self.ways[index, pos] == key
+        if not hit:
+            pos = self.associativity - 1
+        for p in range(pos, 0, -1):
+            self.ways[index, p] = self.ways[index, p - 1]
+        self.ways[index, 0] = key
+        return hit
@@ -1,10 +1,30 @@
-from math import log2
+import importlib.util
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from colorama import Fore, Style
+import numpy as np
+from numba import njit
+from numba.typed import List
 import pandas as pd
 import matplotlib.pyplot as plt
 from tabulate import tabulate
+try:
+    from cache_core import FastCache
+except ImportError:
+    FastCache = None
 
 tracefiles = ['TraceFiles/gcc.trace', 'TraceFiles/gzip.trace', 'TraceFiles/mcf.trace', 'TraceFiles/swim.trace', 'TraceFiles/twolf.trace'] 
+traces = {}
+simulators = {}
+caches = {}
+simulator_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'simulators')
+user_simulator_dir = os.path.join(os.path.expanduser('~'), '.cache', 'cache-simulation', 'simulators')
+# Set CACHE_SIM_VERBOSE to print the full colored table of every sweep
+VERBOSE = os.environ.get('CACHE_SIM_VERBOSE')
 
 class Cache:
     """
@@ -26,136 +46,219 @@ class Cache:
         self.block_size = block_size
         self.associativity = associativity
         self.sets = cache_size//(block_size*associativity)
-        self.no_of_ind_bits = int(log2(self.sets))
-        self.no_of_offset_bits = int(log2(self.block_size))
+        assert self.sets > 0 and self.sets & (self.sets - 1) == 0, "number of sets must be a power of two"
+        assert self.block_size > 0 and self.block_size & (self.block_size - 1) == 0, "block size must be a power of two"
+        self.no_of_ind_bits = self.sets.bit_length() - 1
+        self.no_of_offset_bits = self.block_size.bit_length() - 1
         self.no_of_tag_bits = 32 - self.no_of_ind_bits - self.no_of_offset_bits
+        self.index_shift = self.no_of_offset_bits
+        self.index_mask = self.sets - 1
+        self.tag_shift = self.no_of_offset_bits + self.no_of_ind_bits
         self.hit_count = 0
         self.miss_count = 0
-        self.cache = [[Block('0'*self.no_of_tag_bits, False) for i in range(self.associativity)] for j in range(self.sets)]
-
-    def check(self, address: str):
-        """
-        Check if the given address is present in the cache.
-        
-        Args:
-            address (str): The binary address from the processor.
+        # Each way is one word holding (tag << 1) | valid; a set keeps its ways ordered from
+        # most to least recently used, so the position of a way is its LRU rank
+        self.ways = np.zeros((self.sets, self.associativity), dtype=np.uint32 if self.no_of_tag_bits < 32 else np.uint64)
+        if FastCache is not None and self.ways.dtype == np.uint32:
+            self.core = FastCache(self.ways, self.index_shift, self.index_mask, self.tag_shift)
+        else:
+            self.core = None
 
-        Returns:
-            bool: True if the address is found in the cache (hit), False otherwise (miss).
+    def reset(self):
         """
-        index = self.extract_index(address)
-        tag = self.extract_tag(address)
-        offset = self.extract_offset(address)
-        for block in self.cache[index]:
-            if block.tag == tag and block.valid:
-                self.hit_count += 1
-                self.lru_handling(index, True, block.lru_counter)
-                return True
-        self.miss_count += 1
-        self.evictor(index, tag, offset)
-        self.lru_handling(index, False)
-        return False
-
-    def extract_index(self, address: str):
-        """
-        Extract the index from the binary address.
-        
-        Args:
-            address (str): Binary address of the memory access.
-        
-        Returns:
-            int: Extracted index value.
+        Empty the cache and clear the hit/miss counts, reusing the existing arrays instead
+        of allocating a new cache of the same configuration.
         """
-        index_bits = address[self.no_of_tag_bits: self.no_of_tag_bits + self.no_of_ind_bits]
-        return int(index_bits, 2)
+        self.hit_count = 0
+        self.miss_count = 0
+        self.ways.fill(0)
 
-    def extract_tag(self, address: str):
+    def check(self, address: int):
         """
-        Extract the tag from the binary address.
+        Check if the given address is present in the cache. The lookup is done by the
+        compiled FastCache when cache_core has been built, and with NumPy otherwise.
         
         Args:
-            address (str): Binary address of the memory access.
-        
-        Returns:
-            str: Extracted tag bits.
-        """
-        tag_bits = address[:self.no_of_tag_bits]
-        return tag_bits
+            address (int): The 32-bit address from the processor.
 
-    def extract_offset(self, address: str):
-        """
-        Extract the offset from the binary address.
-        
-        Args:
-            address (str): Binary address of the memory access.
-        
         Returns:
-            int: Extracted offset value.
-        """
-        offset_bits = address[-self.no_of_offset_bits:]
-        return int(offset_bits, 2)
-
-    def lru_handling(self, set_index: int, hit: bool, cur: int=None):
-        """
-        Update the LRU counters for the cache blocks in a set based on whether the access 
-        was a hit or miss. If hit, adjust the LRU position for the accessed block.
-        
-        Args:
-            set_index (int): The index of the cache set being accessed.
-            hit (bool): True if the access was a hit, False otherwise.
-            cur (int, optional): The current LRU counter of the hit block (only used for hit).
+            bool: True if the address is found in the cache (hit), False otherwise (miss).
         """
+        if self.core is not None:
+            hit = self.core.check(address)
+            if hit:
+                self.hit_count += 1
+            else:
+                self.miss_count += 1
+            return hit
+        index = (address >> self.index_shift) & self.index_mask
+        key = ((address >> self.tag_shift) << 1) | 1
+        ways = self.ways[index]
+        hit_mask = ways == key
+        hit = bool(hit_mask.any())
         if hit:
-            for block in self.cache[set_index]:
-                if block.lru_counter > cur:
-                    block.lru_counter -= 1
-                elif block.lru_counter == cur:
-                    block.lru_counter = self.associativity - 1
+            self.hit_count += 1
+            pos = hit_mask.argmax()
         else:
-            for block in self.cache[set_index]:
-                block.lru_counter -= 1
-
-    def evictor(self, set_index: int, tag: str, offset: str):
+            self.miss_count += 1
+            # The least recently used way (or an empty one) drops off the end
+            pos = self.associativity - 1
+        ways[1:pos + 1] = ways[:pos]
+        ways[0] = key
+        return hit
+
+    def simulate(self, addresses: np.ndarray):
         """
-        Evict the least recently used block from a cache set if no empty blocks are available.
-        Otherwise, allocate a free block for the new tag.
+        Run a whole trace through the cache, updating the hit/miss counts and the
+        state of the cache.
         
         Args:
-            set_index (int): The index of the set where eviction or block placement occurs.
-            tag (str): The tag to be placed in the cache block.
-            offset (str): Offset from the address (not used here but included for future use).
+            addresses (np.ndarray): The 32-bit addresses of the trace, as returned by load_trace.
         """
-        for block in self.cache[set_index]:
-            if not block.valid:
-                block.tag = tag
-                block.valid = True
-                block.lru_counter = self.associativity
-                return 
-        for block in self.cache[set_index]:
-            if block.lru_counter == 0:
-                block.tag = tag
-                block.valid = True
-                block.lru_counter = self.associativity
-                return
-
-class Block:
+        simulator = make_simulator(self.associativity, self.no_of_offset_bits, self.no_of_ind_bits)
+        hits, misses = simulator.simulate(addresses, self.ways)
+        self.hit_count += hits
+        self.miss_count += misses
+
+simulator_template = """import numpy as np
+from numba import njit, prange
+
+LOW_BITS = np.uint64(0x0000000100000001)
+HIGH_BITS = np.uint64(0x8000000080000000)
+LOW_LANE = np.uint64(0x80000000)
+
+@njit(cache={cache})
+def simulate(addresses, ways):
+{prologue}    hits = 0
+    misses = 0
+    for i in range(addresses.size):
+        address = np.int64(addresses[i])
+        index = (address >> {index_shift}) & {index_mask}
+        key = ((address >> {tag_shift}) << 1) | 1
+        row = ways[index]
+        pos = {associativity}
+        # A set whose most recently used slot is empty holds no blocks at all
+        if row[0]:
+{lookup}
+        if pos < {associativity}:
+            hits += 1
+        else:
+            misses += 1
+            pos = {last}
+        for p in range(pos, 0, -1):
+            row[p] = row[p - 1]
+        row[0] = key
+    return hits, misses
+
+@njit(cache={cache}, parallel=True)
+def simulate_all(traces, ways, hits, misses):
+    for t in prange(len(traces)):
+        # The prange index is unsigned; a signed one indexes the typed lists without a cast warning
+        i = np.intp(t)
+        h, m = simulate(traces[i], ways[i])
+        hits[t] = h
+        misses[t] = m
+"""
+
+def make_simulator(associativity, offset_bits, index_bits):
     """
-    A class representing a cache block. It stores the tag, validity, and the LRU counter 
-    used for LRU replacement policy.
+    Generate the compiled simulation loop for one cache configuration. The shifts and
+    masks are baked in as constants and the compare is unrolled over the ways. Every way
+    is a single word holding its tag and valid bit, and each set keeps its ways ordered
+    from most to least recently used: an access moves its word to the front and a miss
+    drops the word at the back. Empty ways are zero, so they never match and sit at the
+    back of the set. The generated source is written to `simulator_dir`, or to
+    `user_simulator_dir` when that cannot be written, so that Numba can cache the
+    compiled code between runs. If neither can be written, the source is executed in
+    memory and compiled without caching.
+    
+    When the ways are 32-bit words and the associativity is even, they are compared two
+    at a time as 64-bit words: XOR with the key in both halves leaves a zero half for the
+    matching way, which (x - LOW_BITS) & ~x & HIGH_BITS flags without branching. All pairs
+    are tested up front and the flags of the first matching pair give the position.
+    
+    Args:
+        associativity (int): Cache associativity (number of blocks per set).
+        offset_bits (int): Number of offset bits of an address.
+        index_bits (int): Number of index bits of an address.
+    
+    Returns:
+        module: The generated module. simulate(addresses, ways) runs one trace and returns
+        its number of hits and misses; simulate_all(traces, ways, hits, misses) runs one
+        trace per cache in parallel threads and stores the counts in the hits and misses
+        arrays.
     """
-    def __init__(self, tag: str, valid: bool, lru_counter: int=-1):
-        """
-        Initialize a block with a tag, valid bit, and LRU counter.
-
-        Args:
-            tag (str): The tag of the block.
-            valid (bool): The validity of the block (True if the block contains valid data).
-            lru_counter (int, optional): The current LRU counter value.
-        """
-        self.tag = tag
-        self.valid = valid
-        self.data = "0"*32
-        self.lru_counter = lru_counter
+    key = (associativity, offset_bits, index_bits)
+    if key not in simulators:
+        narrow = offset_bits + index_bits > 0
+        if narrow and associativity % 2 == 0:
+            # A zero in the low half of a word is always flagged exactly, while the borrow
+            # out of it can also flag the high half. The low half holds the first way of
+            # the pair on little-endian machines and the second one on big-endian machines.
+            low, high = (0, 1) if sys.byteorder == 'little' else (1, 0)
+            pairs = range(associativity // 2)
+            lookup = "\n".join(
+                [f"            pattern = np.uint64(key) * LOW_BITS"] +
+                [f"            x = pairs[index, {pair}] ^ pattern\n"
+                 f"            found{pair} = (x - LOW_BITS) & ~x & HIGH_BITS"
+                 for pair in pairs] +
+                [f"            {'if' if pair == 0 else 'elif'} found{pair}:\n"
+                 f"                pos = {2 * pair + low} if found{pair} & LOW_LANE else {2 * pair + high}"
+                 for pair in pairs])
+            prologue = "    pairs = ways.view(np.uint64)\n"
+        else:
+            lookup = "\n".join(
+                f"            {'if' if way == 0 else 'elif'} row[{way}] == key:\n"
+                f"                pos = {way}"
+                for way in range(associativity))
+            prologue = ""
+        fields = dict(
+            associativity=associativity, prologue=prologue, lookup=lookup,
+            index_shift=offset_bits, index_mask=(1 << index_bits) - 1, tag_shift=offset_bits + index_bits,
+            last=associativity - 1)
+        source = simulator_template.format(cache=True, **fields)
+        name = f'simulate_a{associativity}_o{offset_bits}_i{index_bits}'
+        for directory in (simulator_dir, user_simulator_dir):
+            path = os.path.join(directory, name + '.py')
+            try:
+                write_simulator(path, source)
+                break
+            except OSError:
+                pass
+        else:
+            path = None
+        if path is None:
+            module = types.ModuleType(name)
+            exec(simulator_template.format(cache=False, **fields), module.__dict__)
+        else:
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+        simulators[key] = module
+    return simulators[key]
+
+def write_simulator(path, source):
+    """
+    Write the source of a generated simulator, unless the file already holds it. The
+    file is replaced atomically, so processes generating the same simulator never
+    import a half written file.
+    
+    Args:
+        path (str): Path of the generated module.
+        source (str): Source code of the generated module.
+    
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    if os.path.exists(path):
+        with open(path) as file:
+            if file.read() == source:
+                return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.{os.getpid()}', 'w') as file:
+        file.write(source)
+    os.replace(f'{path}.{os.getpid()}', path)
 
 def plot(x_label, y_label,title, dfs, filename):
     """
@@ -168,29 +271,119 @@ def plot(x_label, y_label,title, dfs, filename):
         dfs (list): List of dataframes containing the data to be plotted.
         filename (str): Filename for saving the plot.
     """
-    for i, df in enumerate(dfs):
-        plt.plot(df[x_label], df[y_label], label = tracefiles[i],marker='o')    
-    plt.grid(True)
-    plt.xlabel(x_label)
-    plt.ylabel(y_label)
-    plt.title(title)
-    plt.legend()
-    plt.savefig(filename)
+    combined = pd.concat([df.set_index(x_label)[y_label].rename(tracefiles[i]) for i, df in enumerate(dfs)], axis=1)
+    ax = combined.plot(marker='o', grid=True, xlabel=x_label, ylabel=y_label, title=title)
+    ax.figure.savefig(filename)
     plt.show()
 
-def hextobin(address):
+@njit(cache=True)
+def parse_addresses(data):
+    """
+    Decode the addresses of a tracefile in a single compiled pass over its bytes. Every
+    "0x" followed by hexadecimal digits is an address; the digits are accumulated as
+    they are scanned, so no intermediate string or token is built.
+    
+    Args:
+        data (np.ndarray): The contents of the tracefile as uint8.
+    
+    Returns:
+        np.ndarray: The 32-bit addresses of the trace, in access order.
+    """
+    addresses = np.empty(data.size // 3 + 1, dtype=np.uint32)
+    count = 0
+    i = 0
+    while i < data.size - 1:
+        if data[i] != 48 or (data[i + 1] != 120 and data[i + 1] != 88):
+            i += 1
+            continue
+        i += 2
+        start = i
+        address = 0
+        while i < data.size:
+            c = data[i]
+            if 48 <= c <= 57:
+                digit = c - 48
+            elif 97 <= c <= 102:
+                digit = c - 87
+            elif 65 <= c <= 70:
+                digit = c - 55
+            else:
+                break
+            address = address * 16 + digit
+            i += 1
+        if i > start:
+            addresses[count] = address
+            count += 1
+    return addresses[:count].copy()
+
+def load_trace(tracefile):
+    """
+    Read the memory addresses of a tracefile into an array. The file is memory-mapped
+    and decoded by parse_addresses. Parsed traces are kept in `traces`, so every
+    tracefile is only read once and then shared by all the parts.
+    
+    Args:
+        tracefile (str): Path of the tracefile to be read.
+    
+    Returns:
+        np.ndarray: The 32-bit addresses of the trace, in access order.
+    """
+    if tracefile not in traces:
+        traces[tracefile] = parse_addresses(np.memmap(tracefile, dtype=np.uint8, mode='r'))
+    return traces[tracefile]
+
+def simulate_one(addresses, cache_size, block_size, associativity):
     """
-    Convert a hexadecimal address into a 32-bit binary string.
+    Simulate a trace on an empty cache. This is the unit of work the sweeps hand to their
+    worker processes; every process keeps one cache per configuration in `caches` and
+    resets it between traces.
     
     Args:
-        address (str): The hexadecimal address to be converted.
+        addresses (np.ndarray): The 32-bit addresses of the trace.
+        cache_size (int): Total size of the cache in bytes.
+        block_size (int): Size of each cache block in bytes.
+        associativity (int): Cache associativity (number of blocks per set).
+    
+    Returns:
+        tuple: The hit count and miss count of the trace.
+    """
+    key = (cache_size, block_size, associativity)
+    if key in caches:
+        caches[key].reset()
+    else:
+        caches[key] = Cache(cache_size, block_size, associativity)
+    cache1 = caches[key]
+    cache1.simulate(addresses)
+    return cache1.hit_count, cache1.miss_count
+
+def sweep_executor():
+    """
+    Create the process pool the sweeps run simulate_one() on. The workers are spawned
+    rather than forked: parta starts Numba's worker threads, and a forked worker would
+    inherit them locked. Spawning is also available on every platform.
     
     Returns:
-        str: A 32-bit binary string representation of the address.
+        ProcessPoolExecutor: A pool with one worker per CPU core.
     """
-    num=str(bin(int(address,base=16)))
-    num=num[2:]
-    return num.zfill(32)
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+
+def simulate_all(cache_list, addresses):
+    """
+    Simulate one trace on each of a list of caches with the same configuration. The
+    traces run in parallel threads inside the compiled code, one cache per thread.
+    
+    Args:
+        cache_list (list): The caches to be simulated.
+        addresses (list): The 32-bit addresses of one trace per cache.
+    """
+    cache1 = cache_list[0]
+    simulator = make_simulator(cache1.associativity, cache1.no_of_offset_bits, cache1.no_of_ind_bits)
+    hits = np.zeros(len(cache_list), dtype=np.int64)
+    misses = np.zeros(len(cache_list), dtype=np.int64)
+    simulator.simulate_all(List(addresses), List([cache.ways for cache in cache_list]), hits, misses)
+    for cache, hit_count, miss_count in zip(cache_list, hits.tolist(), misses.tolist()):
+        cache.hit_count += hit_count
+        cache.miss_count += miss_count
 
 def parta():
     """
@@ -200,13 +393,9 @@ def parta():
     cache_size = 1024 * 1024  
     block_size = 4  
     associativity = 4  
-    for tracefile in tracefiles:
-        cache1 = Cache(cache_size, block_size, associativity)
-        with open(tracefile, 'r') as file:
-            for line in file:
-                address_hex = line.split()[1][2:]
-                address_bin = hextobin(address_hex)
-                cache1.check(address_bin)
+    caches1 = [Cache(cache_size, block_size, associativity) for tracefile in tracefiles]
+    simulate_all(caches1, [load_trace(tracefile) for tracefile in tracefiles])
+    for tracefile, cache1 in zip(tracefiles, caches1):
         hit_rate = cache1.hit_count / (cache1.hit_count + cache1.miss_count)
         miss_rate = cache1.miss_count / (cache1.hit_count + cache1.miss_count)
         print(f'{Fore.GREEN}Hit Rate{Style.RESET_ALL} for {Fore.CYAN}{tracefile}{Style.RESET_ALL}: {Fore.GREEN}{hit_rate * 100:.6f}%{Style.RESET_ALL}')
@@ -222,25 +411,19 @@ def partb():
     dfs = []
     cache_sizes = [1024 * 2 ** i for i in range(7, 12 + 1)]
     cache_sizes_kb = [i // 1024 for i in cache_sizes]
-    with pd.ExcelWriter('Changing_CacheSize.xlsx', engine='openpyxl') as writer:
+    with pd.ExcelWriter('Changing_CacheSize.xlsx', engine='xlsxwriter') as writer, sweep_executor() as executor:
+        results = {tracefile: executor.map(simulate_one, repeat(load_trace(tracefile)), cache_sizes, repeat(4), repeat(4)) for tracefile in tracefiles}
         for tracefile in tracefiles:
             hit_rates = []
             miss_rates = []
             hit_counts = []
             miss_counts = []
 
-            for cache_size in cache_sizes:
-                cache1 = Cache(cache_size, 4, 4)
-                with open(tracefile, 'r') as file:
-                    for line in file:
-                        address_hex = line.split()[1][2:]
-                        address_bin = hextobin(address_hex)
-                        cache1.check(address_bin)
-
-                hit_rates.append((cache1.hit_count / (cache1.hit_count + cache1.miss_count)) * 100)
-                miss_rates.append((cache1.miss_count / (cache1.hit_count + cache1.miss_count)) * 100)
-                hit_counts.append(cache1.hit_count)
-                miss_counts.append(cache1.miss_count)
+            for hit_count, miss_count in results[tracefile]:
+                hit_rates.append((hit_count / (hit_count + miss_count)) * 100)
+                miss_rates.append((miss_count / (hit_count + miss_count)) * 100)
+                hit_counts.append(hit_count)
+                miss_counts.append(miss_count)
 
             df = pd.DataFrame({
                 'Cache Size (in kb)': cache_sizes_kb,
@@ -249,19 +432,22 @@ def partb():
                 'Hit Rate': hit_rates,
                 'Miss Rate': miss_rates
             })
-            df.to_excel(writer, sheet_name=tracefile.split('.')[0], index=False)
-
-            print(tracefile)
-            print()
-            temp_df = pd.DataFrame({
-                'Cache Size (in kb)': [f"{Fore.LIGHTBLUE_EX}{size}{Style.RESET_ALL}" for size in cache_sizes_kb],
-                'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
-                'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
-                'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
-                'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
-            })
-            print(tabulate(temp_df, headers='keys', tablefmt="grid"))
-            print()
+            df.to_excel(writer, sheet_name=os.path.splitext(os.path.basename(tracefile))[0], index=False)
+
+            if VERBOSE:
+                print(tracefile)
+                print()
+                temp_df = pd.DataFrame({
+                    'Cache Size (in kb)': [f"{Fore.LIGHTBLUE_EX}{size}{Style.RESET_ALL}" for size in cache_sizes_kb],
+                    'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
+                    'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
+                    'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
+                    'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
+                })
+                print(tabulate(temp_df, headers='keys', tablefmt="grid"))
+                print()
+            else:
+                print(f"{tracefile}: hit_rates={', '.join(f'{hit_rate:.6f}' for hit_rate in hit_rates)}")
             dfs.append(df)
 
     plot('Cache Size (in kb)', 'Miss Rate', "Cache Size vs Miss Rate", dfs, "Cache Size vs Miss Rate")
@@ -275,39 +461,36 @@ def partc():
     dfs=[]
     cache_size = 1024 * 1024
     block_sizes = [2 ** i for i in range(0, 7 + 1)]
-    with pd.ExcelWriter('Changing_BlockSize.xlsx', engine='openpyxl') as writer:
+    with pd.ExcelWriter('Changing_BlockSize.xlsx', engine='xlsxwriter') as writer, sweep_executor() as executor:
+        results = {tracefile: executor.map(simulate_one, repeat(load_trace(tracefile)), repeat(cache_size), block_sizes, repeat(4)) for tracefile in tracefiles}
         for tracefile in tracefiles:
             hit_rates = []
             miss_rates = []
             hit_counts = []
             miss_counts = []
-            for block_size in block_sizes:
-                cache1 = Cache(cache_size, block_size, 4)
-                with open(tracefile, 'r') as file:
-                    for line in file:
-                        address_hex = line.split()[1][2:]
-                        address_bin = hextobin(address_hex)
-                        cache1.check(address_bin)
-
-                hit_rates.append((cache1.hit_count / (cache1.hit_count + cache1.miss_count))*100)
-                miss_rates.append((cache1.miss_count / (cache1.hit_count + cache1.miss_count))*100)
-                hit_counts.append(cache1.hit_count)
-                miss_counts.append(cache1.miss_count)
+            for hit_count, miss_count in results[tracefile]:
+                hit_rates.append((hit_count / (hit_count + miss_count))*100)
+                miss_rates.append((miss_count / (hit_count + miss_count))*100)
+                hit_counts.append(hit_count)
+                miss_counts.append(miss_count)
 
             df = pd.DataFrame({'Block Size': block_sizes, 'Hit count': hit_counts, 'Miss count': miss_counts, 'Hit Rate': hit_rates, 'Miss Rate': miss_rates})
-            df.to_excel(writer, sheet_name=tracefile.split('.')[0], index=False)
-            temp_df = pd.DataFrame({
-                'Block Size': [f"{Fore.LIGHTBLUE_EX}{block_size}{Style.RESET_ALL}" for block_size in block_sizes],
-                'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
-                'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
-                'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
-                'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
-            })
-
-            print(tracefile)
-            print()
-            print(tabulate(temp_df, headers='keys',tablefmt="grid"))
-            print()
+            df.to_excel(writer, sheet_name=os.path.splitext(os.path.basename(tracefile))[0], index=False)
+            if VERBOSE:
+                temp_df = pd.DataFrame({
+                    'Block Size': [f"{Fore.LIGHTBLUE_EX}{block_size}{Style.RESET_ALL}" for block_size in block_sizes],
+                    'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
+                    'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
+                    'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
+                    'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
+                })
+
+                print(tracefile)
+                print()
+                print(tabulate(temp_df, headers='keys',tablefmt="grid"))
+                print()
+            else:
+                print(f"{tracefile}: hit_rates={', '.join(f'{hit_rate:.6f}' for hit_rate in hit_rates)}")
             dfs.append(df)
 
     plot('Block Size', 'Miss Rate','Block Size vs Miss Rate', dfs, 'Block Size vs Miss Rate')
@@ -322,38 +505,35 @@ def partd():
     cache_size = 1024 * 1024
     block_size = 4
     associativities = [2 ** i for i in range(0, 6 + 1)]
-    with pd.ExcelWriter('Changing_Associativity.xlsx', engine='openpyxl') as writer:
+    with pd.ExcelWriter('Changing_Associativity.xlsx', engine='xlsxwriter') as writer, sweep_executor() as executor:
+        results = {tracefile: executor.map(simulate_one, repeat(load_trace(tracefile)), repeat(cache_size), repeat(block_size), associativities) for tracefile in tracefiles}
         for tracefile in tracefiles:
             hit_rates = []
             miss_rates = []
             hit_counts = []
             miss_counts = []
-            for associativity in associativities:
-                cache1 = Cache(cache_size, block_size, associativity)
-                with open(tracefile, 'r') as file:
-                    for line in file:
-                        address_hex = line.split()[1][2:]
-                        address_bin = hextobin(address_hex)
-                        cache1.check(address_bin)
-
-                hit_rates.append((cache1.hit_count / (cache1.hit_count + cache1.miss_count))*100)
-                miss_rates.append((cache1.miss_count / (cache1.hit_count + cache1.miss_count))*100)
-                hit_counts.append(cache1.hit_count)
-                miss_counts.append(cache1.miss_count)
+            for hit_count, miss_count in results[tracefile]:
+                hit_rates.append((hit_count / (hit_count + miss_count))*100)
+                miss_rates.append((miss_count / (hit_count + miss_count))*100)
+                hit_counts.append(hit_count)
+                miss_counts.append(miss_count)
 
             df = pd.DataFrame({'Associativity': associativities, 'Hit count': hit_counts, 'Miss count': miss_counts, 'Hit Rate': hit_rates, 'Miss Rate': miss_rates})
-            df.to_excel(writer, sheet_name=tracefile.split('.')[0], index=False)
-            temp_df = pd.DataFrame({
-                'Associativity': [f"{Fore.LIGHTBLUE_EX}{assoc}{Style.RESET_ALL}" for assoc in associativities],
-                'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
-                'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
-                'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
-                'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
-            })
-            print(tracefile)
-            print()
-            print(tabulate(temp_df, headers='keys',tablefmt="grid")+"\n")
-            print()
+            df.to_excel(writer, sheet_name=os.path.splitext(os.path.basename(tracefile))[0], index=False)
+            if VERBOSE:
+                temp_df = pd.DataFrame({
+                    'Associativity': [f"{Fore.LIGHTBLUE_EX}{assoc}{Style.RESET_ALL}" for assoc in associativities],
+                    'Hit count': [f"{Fore.GREEN}{hit}{Style.RESET_ALL}" for hit in hit_counts],
+                    'Miss count': [f"{Fore.RED}{miss}{Style.RESET_ALL}" for miss in miss_counts],
+                    'Hit Rate': [f"{Fore.GREEN}{hit_rate:.6f}{Style.RESET_ALL}" for hit_rate in hit_rates],
+                    'Miss Rate': [f"{Fore.RED}{miss_rate:.6f}{Style.RESET_ALL}" for miss_rate in miss_rates]
+                })
+                print(tracefile)
+                print()
+                print(tabulate(temp_df, headers='keys',tablefmt="grid")+"\n")
+                print()
+            else:
+                print(f"{tracefile}: hit_rates={', '.join(f'{hit_rate:.6f}' for hit_rate in hit_rates)}")
             dfs.append(df)
     plot('Associativity', 'Hit Rate','Associativity vs Hit Rate', dfs,'Associativity vs Hit Rate')
         